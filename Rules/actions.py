@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from typing import Dict, List
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterator, List, Tuple
 
 from speckle_automate import AutomationContext
 
@@ -14,9 +15,21 @@ class ParameterAction(ABC):
     """
 
     def __init__(self) -> None:
-        # Dictionary for tracking affected parameters. Key: parent object's ID,
-        # Value: list of affected parameter names.
-        self.affected_parameters: Dict[str, List[str]] = defaultdict(list)
+        # Parallel lists for tracking affected parameters. Entry i pairs the
+        # parent object's ID with the name of an affected parameter.
+        self.parent_ids: List[str] = []
+        self.param_names: List[str] = []
+
+    def affected_parameters_by_parent(self) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Groups the affected parameter names by their parent object's ID.
+
+        Yields:
+            tuple: A parent object's ID and the names of its affected parameters.
+        """
+        pairs = sorted(zip(self.parent_ids, self.param_names), key=itemgetter(0))
+        for parent_id, group in groupby(pairs, key=itemgetter(0)):
+            yield parent_id, [param_name for _, param_name in group]
 
     @abstractmethod
     def apply(self, parameter: Dict[str, str], parent_object: Dict[str, str]) -> None:
@@ -1,8 +1,29 @@
 # Required imports
-from typing import Callable, Dict, Union
+from operator import methodcaller
+from typing import Callable, Dict, Iterable, Tuple, Union
 
 from specklepy.objects import Base
 
+REVIT_PARAMETER_TYPE = "Objects.BuiltElements.Revit.Parameter"
+
+
+def has_speckle_type(obj, speckle_type: str) -> bool:
+    """
+    Checks if an object's speckle_type matches the given type.
+    """
+    return getattr(obj, "speckle_type", None) == speckle_type
+
+
+def _as_prefixes(prefixes: Union[str, Iterable[str]]) -> Union[str, Tuple[str, ...]]:
+    """
+    Normalizes one or many prefixes into a form `str.startswith` accepts.
+
+    A tuple lets CPython test every candidate prefix in a single C-level call.
+    """
+    if isinstance(prefixes, str):
+        return prefixes
+    return tuple(prefixes)
+
 
 # We're going to define a set of rules that will allow us to filter and
 # process parameters in our Speckle objects. These rules will be encapsulated
@@ -29,15 +50,19 @@ class BaseObjectRules:
         )
 
     @staticmethod
-    def forbidden_prefix_rule(given_prefix: str) -> Callable[[Base], bool]:
+    def forbidden_prefix_rule(
+        given_prefix: Union[str, Iterable[str]]
+    ) -> Callable[[Base], bool]:
         """
         Rule: check if a parameter's name starts with a given prefix.
 
         This is a simple check, but there could be more complex naming rules for parameters of
         different types. For example, a rule that checks if a parameter's name starts with a given string
         exists particularly within IFC where parameters are often prefixed with "Ifc" or "Pset".
+        Several prefixes may be given at once, e.g. ("Ifc", "Pset").
         """
-        return lambda parameter: parameter.name.startswith(given_prefix)
+        prefixes = _as_prefixes(given_prefix)
+        return lambda parameter: parameter.name.startswith(prefixes)
 
     # This example Automate function is for prefixed parameter removal. Additional example rules below follow the same
     # pattern, but with different logic. In some instances there is a strong coupling between the action and the checking
@@ -53,7 +78,7 @@ class BaseObjectRules:
         This rule checks if a parameter is missing its value, potentially indicating
         an oversight during data entry or transfer.
         """
-        return not getattr(parameter, "value")
+        return not getattr(parameter, "value", None)
 
     @staticmethod
     def has_default_value(parameter: Dict[str, str]) -> bool:
@@ -93,19 +118,30 @@ class BaseObjectRules:
 
         This rule checks if a parameter's name matches the desired name.
         """
-        return (
-            lambda parameter: getattr(parameter, "name") is not None
-                              and parameter.name == parameter_name
-        )
+        return lambda parameter: getattr(parameter, "name", None) == parameter_name
 
     @staticmethod
-    def parameter_value_startswith(prefix: str) -> Callable[[Base], bool]:
+    def parameter_value_startswith(
+        prefix: Union[str, Iterable[str]]
+    ) -> Callable[[Base], bool]:
         """
         Rule: Parameter Name Starts With.
 
-        This rule checks if a parameter's name starts with a given prefix.
+        This rule checks if a parameter's name starts with a given prefix, or
+        with any of several prefixes.
+        """
+        prefixes = _as_prefixes(prefix)
+        return lambda parameter: parameter.name.startswith(prefixes)
+
+    @staticmethod
+    def value_startswith(prefix: str) -> Callable[[str], bool]:
+        """
+        Rule: Value Starts With.
+
+        This rule checks if a parameter value string starts with a given prefix.
+        It is built once per run and passed to `evaluate_parameter`.
         """
-        return lambda parameter: parameter.name.startswith(prefix)
+        return methodcaller("startswith", prefix)
 
     @staticmethod
     def is_revit_parameter(parameter: Union[Base, Dict[str, str]]):
@@ -115,23 +151,27 @@ class BaseObjectRules:
         This function checks if a parameter is a Revit parameter by checking if it
         has a 'category' property.
         """
-        return (
-                getattr(parameter, "speckle_type", None)
-                == "Objects.BuiltElements.Revit.Parameter"
-        )
+        return has_speckle_type(parameter, REVIT_PARAMETER_TYPE)
 
     @staticmethod
-    def evaluate_parameter(parameter, function_inputs):
+    def evaluate_parameter(parameter, value_is_valid: Callable[[str], bool]):
+        """
+        Evaluates a parameter and returns its evaluation state.
 
-        """Evaluates a parameter and returns its evaluation state."""
-        if not BaseObjectRules.is_revit_parameter(parameter):
+        Args:
+            parameter: The parameter to evaluate.
+            value_is_valid: Prebuilt rule applied to string values, e.g. from
+                `value_startswith`.
+        """
+        # Inlined is_revit_parameter check; this runs once per parameter
+        if getattr(parameter, "speckle_type", None) != REVIT_PARAMETER_TYPE:
             return None
 
         if BaseObjectRules.has_missing_value(parameter):
             return "missing"
 
         value = getattr(parameter, "value", None)
-        if value is not None and isinstance(value, str) and value.startswith(function_inputs.single_rule):
+        if isinstance(value, str) and value_is_valid(value):
             return "passing"
         else:
             return "invalid"
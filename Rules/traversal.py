@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from specklepy.objects.graph_traversal.traversal import TraversalRule, GraphTraversal
 
 
+@lru_cache(maxsize=1)
 def get_data_traversal_rules() -> GraphTraversal:
     """
     Generates traversal rules for navigating Speckle data structures.
@@ -24,6 +27,9 @@ def get_data_traversal_rules() -> GraphTraversal:
         - It aims to traverse all member names of an object while avoiding
           deprecated members (a potential enhancement for the future).
 
+    The rules hold no per-run state and GraphTraversal is immutable, so the
+    instance is built once and shared between runs.
+
     Returns:
         GraphTraversal: A GraphTraversal instance initialized with the
         defined rules.
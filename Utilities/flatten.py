@@ -4,8 +4,9 @@ extracting base objects along with their transformations. It's designed for AEC
 professionals working with complex Speckle data structures.
 """
 
+from collections import deque
 from collections.abc import Iterable
-from typing import Optional, Tuple, List
+from typing import Optional, Sequence, Tuple
 
 from specklepy.objects import Base
 from specklepy.objects.other import Instance, Transform
@@ -22,69 +23,88 @@ def flatten_base(base: Base, parent_type: str = None) -> Iterable[Base]:
     Yields:
         Base: A flattened base object, making complex hierarchies linear.
     """
-    if isinstance(base, Base):
-        base["parent_type"] = parent_type
-
-    # Handle collections of elements in the base object
-    if hasattr(base, "elements") and base.elements:
-        try:
-            for element in base.elements:
-                yield from flatten_base(element, base.speckle_type)
-        except KeyError:
-            pass
-    # Handle older Revit-specific patterns with '@Lines'
-    elif hasattr(base, "@Lines"):
-        categories = base.get_dynamic_member_names()
-        for category in categories:
-            if category.startswith("@"):
-                category_object: Base = getattr(base, category)[0]
-                yield from flatten_base(category_object, category_object.speckle_type)
-    else:
-        yield base
+    # Iterative depth-first walk; children are pushed in reverse so they are
+    # popped, and therefore yielded, in their original order.
+    stack = deque([(base, parent_type)])
+
+    while stack:
+        node, node_parent_type = stack.pop()
+        if isinstance(node, Base):
+            node["parent_type"] = node_parent_type
+
+        # Handle collections of elements in the base object
+        if hasattr(node, "elements") and node.elements:
+            stack.extend(
+                (element, node.speckle_type) for element in reversed(node.elements)
+            )
+        # Handle older Revit-specific patterns with '@Lines'
+        elif hasattr(node, "@Lines"):
+            categories = node.get_dynamic_member_names()
+            category_objects = [
+                getattr(node, category)[0]
+                for category in categories
+                if category.startswith("@")
+            ]
+            stack.extend(
+                (category_object, category_object.speckle_type)
+                for category_object in reversed(category_objects)
+            )
+        else:
+            yield node
 
 
 def extract_base_and_transform(
     base: Base,
     inherited_instance_id: Optional[str] = None,
-    transform_list: Optional[List[Transform]] = None,
-) -> Tuple[Base, str, Optional[List[Transform]]]:
+    transform_list: Optional[Sequence[Transform]] = None,
+) -> Iterable[Tuple[Base, str, Tuple[Transform, ...]]]:
     """
     Extracts `Base` objects and their transformations from Speckle data.
 
     Args:
         base: The starting point `Base` object for traversal.
         inherited_instance_id: Inherited ID for objects without a unique one.
-        transform_list: List of transformations from parent to child objects.
+        transform_list: Transformations from parent to child objects.
 
     Yields:
         tuple: A `Base` object, its identifier, and applicable transforms.
     """
-    current_id = getattr(base, "id", inherited_instance_id)
-    transform_list = transform_list or []
-
-    if isinstance(base, Instance):
-        if base.transform:
-            transform_list.append(base.transform)
-        if base.definition:
-            yield from extract_base_and_transform(
-                base.definition, current_id, transform_list.copy()
-            )
-    else:
-        yield base, current_id, transform_list
+    # Transforms are carried as immutable tuples, so siblings share their
+    # parent's chain and a new tuple is only built when an Instance adds one.
+    stack = [(base, inherited_instance_id, tuple(transform_list or ()))]
+
+    while stack:
+        node, parent_id, transforms = stack.pop()
+        current_id = getattr(node, "id", parent_id)
+
+        if isinstance(node, Instance):
+            if node.transform:
+                transforms = transforms + (node.transform,)
+            if node.definition:
+                stack.append((node.definition, current_id, transforms))
+            continue
+
+        yield node, current_id, transforms
+
+        children = []
 
         # Process 'elements' and '@elements' in the base object
-        elements_attr = getattr(base, "elements", []) or getattr(base, "@elements", [])
-        for element in elements_attr:
-            if isinstance(element, Base):
-                yield from extract_base_and_transform(
-                    element, current_id, transform_list.copy()
-                )
+        elements_attr = getattr(node, "elements", []) or getattr(node, "@elements", [])
+        children.extend(
+            element for element in elements_attr if isinstance(element, Base)
+        )
 
         # Process '@'-prefixed properties in older Speckle data models
-        for attr_name in dir(base):
-            if attr_name.startswith("@"):
-                attr_value = getattr(base, attr_name)
+        # Only dynamic members can be '@'-prefixed, so there is no need to walk
+        # every inherited attribute with dir(). The names come back in set order,
+        # so sort them to keep the same deterministic order dir() gave.
+        if hasattr(node, "get_dynamic_member_names"):
+            for attr_name in sorted(node.get_dynamic_member_names()):
+                if not attr_name.startswith("@"):
+                    continue
+                attr_value = getattr(node, attr_name)
                 if isinstance(attr_value, Base) and hasattr(attr_value, "elements"):
-                    yield from extract_base_and_transform(
-                        attr_value, current_id, transform_list.copy()
-                    )
+                    children.append(attr_value)
+
+        # Reverse so children are popped in their original order
+        stack.extend((child, current_id, transforms) for child in reversed(children))
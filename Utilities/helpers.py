@@ -1,32 +1,65 @@
+from specklepy.objects.other import RevitInstance
+
 from Rules.checks import BaseObjectRules
 
+# Bound once so the per-object parameter check skips the class attribute lookup
+evaluate_parameter = BaseObjectRules.evaluate_parameter
+
+
+# Function to get type and family based on conditions. Instances sharing a
+# definition are resolved once when a per-run cache dict is passed in.
+def get_type_and_family(obj, definition_cache=None):
+    # A RevitInstance's speckle_type carries its full inheritance chain
+    # ("Objects.Other.Instance:Objects.Other.Revit.RevitInstance"), so match on
+    # the class rather than comparing the type string
+    is_revit_instance = isinstance(obj, RevitInstance)
+    definition = getattr(obj, "definition", None) if is_revit_instance else None
+    if definition is None:
+        return getattr(obj, "type", "Unknown"), getattr(obj, "family", "Unknown")
+
+    key = getattr(definition, "id", None) if definition_cache is not None else None
+    if key is not None:
+        cached = definition_cache.get(key)
+        if cached is not None:
+            return cached
+
+    type_and_family = getattr(definition, "type", "Unknown"), getattr(definition, "family", "Unknown")
+    if key is not None:
+        definition_cache[key] = type_and_family
+    return type_and_family
 
-# Function to get type and family based on conditions
-def get_type_and_family(obj):
-    if getattr(obj, "speckle_type", None) == "Objects.Other.Revit.RevitInstance" and hasattr(obj, "definition"):
-        return getattr(obj.definition, "type", "Unknown"), getattr(obj.definition, "family", "Unknown")
-    return getattr(obj, "type", "Unknown"), getattr(obj, "family", "Unknown")
 
+# Function to create an empty bucket of parallel object info lists
+def create_object_bucket():
+    return {"ids": [], "names": [], "types": [], "families": []}
 
-# Function to create object info
-def create_object_info(obj, type_, family):
-    return {
-        "name": getattr(obj, "name", "Unknown"),
-        "type": type_,
-        "family": family,
-        "id": getattr(obj, "id", "Unknown"),
-    }
 
+# Function to get the id and name recorded for an object
+def get_id_and_name(obj):
+    return getattr(obj, "id", "Unknown"), getattr(obj, "name", "Unknown")
 
-# Function to process parameters
-def process_parameters(current_object, function_inputs):
-    parameters = getattr(current_object, "parameters", None)
+
+# Function to append object info to a bucket
+def append_object_info(bucket, object_id, name, type_, family):
+    bucket["ids"].append(object_id)
+    bucket["names"].append(name)
+    bucket["types"].append(type_)
+    bucket["families"].append(family)
+
+
+# Function to process an object's parameters
+def process_parameters(parameters, parameter_name_is, value_is_valid):
     if not parameters:
         return
 
-    parameter_name_is = BaseObjectRules.parameter_name_is(function_inputs.single_property)
+    get_dynamic_member_names = getattr(parameters, "get_dynamic_member_names", None)
+    if get_dynamic_member_names is None:
+        return
 
-    for parameter_key in getattr(parameters, 'get_dynamic_member_names', lambda: [])():
-        parameter = parameters[parameter_key]
+    # Base.__getitem__ reads straight from the instance dict, so index that
+    # directly and skip the Python-level dispatch for every parameter
+    members = vars(parameters)
+    for parameter_key in get_dynamic_member_names():
+        parameter = members[parameter_key]
         if parameter_name_is(parameter):
-            return BaseObjectRules.evaluate_parameter(parameter, function_inputs)
+            return evaluate_parameter(parameter, value_is_valid)
@@ -1,23 +1,55 @@
 import json
-from typing import List, Dict
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from fpdf import FPDF  # To install: `pip install fpdf2`
 
 
-def save_html_report(data: str, filename: str) -> None:
+class Format(Enum):
+    """
+    Format: Enum for defining report formats.
+    """
+
+    PDF = "PDF"
+    HTML = "HTML"
+    JSON = "JSON"
+
+
+# Assessment results keyed by status, each holding parallel lists of
+# "ids", "names", "types" and "families".
+AssessedObjects = Dict[str, Dict[str, List[str]]]
+
+
+def iter_report_rows(
+    data: AssessedObjects,
+) -> Iterator[Tuple[str, str, str, str, str]]:
+    """
+    Yields one (name, type, family, id, status) row per assessed object.
+
+    Args:
+        data: Assessment results keyed by status.
+    """
+    for status, bucket in data.items():
+        for name, type_, family, id_ in zip(
+            bucket["names"], bucket["types"], bucket["families"], bucket["ids"]
+        ):
+            yield name, type_, family, id_, status
+
+
+def save_html_report(data: Iterable[str], filename: str) -> None:
     """
     Saves HTML content as a file, handy for viewing in web browsers.
 
     Args:
-        data (str): HTML content.
+        data (Iterable[str]): HTML content fragments, written as they arrive.
         filename (str): File path to save HTML content.
     """
     with open(filename, "w") as file:
-        file.write(data)
+        file.writelines(data)
 
 
 def save_json_report(
-    data: Dict[str, List[Dict[str, str]]],
+    data: AssessedObjects,
     filename: str,
     single_category: str,
     single_property: str,
@@ -39,14 +71,22 @@ def save_json_report(
             "Property": single_property,
             "Value": single_value,
         },
-        "Results": data,
+        "Results": {
+            status: [
+                {"name": name, "type": type_, "family": family, "id": id_}
+                for name, type_, family, id_ in zip(
+                    bucket["names"], bucket["types"], bucket["families"], bucket["ids"]
+                )
+            ]
+            for status, bucket in data.items()
+        },
     }
     with open(filename, "w") as file:
         json.dump(report_data, file, indent=4)
 
 
 def generate_pdf_report(
-    data: Dict[str, List[Dict[str, str]]],
+    data: AssessedObjects,
     filename: str,
     single_category: str,
     single_property: str,
@@ -70,54 +110,83 @@ def generate_pdf_report(
     pdf.cell(200, 10, txt=criteria_info, ln=True)
     pdf.cell(200, 10, txt="Name | Type | Family | ID | Status", ln=True)
 
-    for status, objects in data.items():
-        for obj in objects:
-            obj_info = f"{obj['name']} | {obj['type']} | {obj['family']} | {obj['id']} | {status}"
-            pdf.cell(200, 10, txt=obj_info, ln=True)
+    # Write all object rows in a single call rather than one cell per object
+    rows = "\n".join(
+        f"{name} | {type_} | {family} | {id_} | {status}"
+        for name, type_, family, id_, status in iter_report_rows(data)
+    )
+    if rows:
+        pdf.multi_cell(0, 10, txt=rows, align="L")
 
     pdf.output(filename)
 
 
 def generate_html_report(
-    data: Dict[str, List[Dict[str, str]]],
+    data: AssessedObjects,
     single_category: str,
     single_property: str,
     single_value: str,
-) -> str:
+) -> Iterator[str]:
     """
     Generates HTML content for the report. Easily styled and readable.
 
+    The content is yielded fragment by fragment, so the full document never
+    has to be held in memory.
+
     Args:
         data: The data to display.
         single_category: Assessment category.
         single_property: Assessment criteria.
         single_value: Assessment value rule.
     """
-    html_content = "<html><head><title>Report</title></head><body>"
-    criteria_header = (
-        f"<h1>Report: {single_category} - {single_property} - {single_value}</h1>"
-    )
-    html_content += criteria_header
-    html_content += "<table border='1'>"
-    html_content += (
-        "<tr><th>Name</th><th>Type</th><th>Family</th><th>ID</th><th>Status</th></tr>"
+    yield "<html><head><title>Report</title></head><body>"
+    yield f"<h1>Report: {single_category} - {single_property} - {single_value}</h1>"
+    yield "<table border='1'>"
+    yield "<tr><th>Name</th><th>Type</th><th>Family</th><th>ID</th><th>Status</th></tr>"
+
+    for name, type_, family, id_, status in iter_report_rows(data):
+        yield (
+            f"<tr><td>{name}</td><td>{type_}</td>"
+            f"<td>{family}</td><td>{id_}</td><td>{status}</td></tr>"
+        )
+
+    yield "</table></body></html>"
+
+
+def write_html_report(
+    data: AssessedObjects,
+    filename: str,
+    single_category: str,
+    single_property: str,
+    single_value: str,
+) -> None:
+    """
+    Generates the HTML report and saves it, matching the other report writers.
+
+    Args:
+        data: The data to display.
+        filename: HTML file to save.
+        single_category: Assessment category.
+        single_property: Assessment criteria.
+        single_value: Assessment value rule.
+    """
+    save_html_report(
+        generate_html_report(data, single_category, single_property, single_value),
+        filename,
     )
 
-    for status, objects in data.items():
-        for obj in objects:
-            row = (
-                f"<tr><td>{obj['name']}</td><td>{obj['type']}</td>"
-                f"<td>{obj['family']}</td><td>{obj['id']}</td><td>{status}</td></tr>"
-            )
-            html_content += row
 
-    html_content += "</table></body></html>"
-    return html_content
+# Report writer for each format, keyed on the Format member itself
+REPORT_WRITERS = {
+    Format.PDF: generate_pdf_report,
+    Format.HTML: write_html_report,
+    Format.JSON: save_json_report,
+}
 
 
 def generate_report(
-    assessed_objects: Dict[str, List[Dict[str, str]]],
-    report_format: str,
+    assessed_objects: AssessedObjects,
+    report_format: Format,
     single_category: str,
     single_property: str,
     single_value: str,
@@ -127,35 +196,22 @@ def generate_report(
 
     Args:
         assessed_objects: Categorized assessment data.
-        report_format: The format to generate ('HTML', 'JSON', 'PDF').
+        report_format: The format to generate (Format.HTML, Format.JSON, Format.PDF).
         single_category: Assessment category.
         single_property: Assessment criteria.
         single_value: Assessment value rule.
     """
-    report_filename = f"report.{report_format.lower()}"
-
-    if report_format == "HTML":
-        html_report = generate_html_report(
-            assessed_objects, single_category, single_property, single_value
-        )
-        save_html_report(html_report, report_filename)
-    elif report_format == "JSON":
-        save_json_report(
-            assessed_objects,
-            report_filename,
-            single_category,
-            single_property,
-            single_value,
-        )
-    elif report_format == "PDF":
-        generate_pdf_report(
-            assessed_objects,
-            report_filename,
-            single_category,
-            single_property,
-            single_value,
-        )
-    else:
+    writer = REPORT_WRITERS.get(report_format)
+    if writer is None:
         raise ValueError("Unsupported report format")
 
+    report_filename = f"report.{report_format.value.lower()}"
+    writer(
+        assessed_objects,
+        report_filename,
+        single_category,
+        single_property,
+        single_value,
+    )
+
     return report_filename
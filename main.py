@@ -3,19 +3,38 @@ This module contains the business logic for a Speckle Automate function.
 It demonstrates how to define input models, traverse and process data,
 and generate reports based on user-specified criteria.
 """
+from collections import defaultdict
 from enum import Enum
+from functools import cache
 
 from pydantic import Field
 from speckle_automate import (
     AutomateBase,
     AutomationContext,
+    ObjectResultLevel,
     execute_automate_function,
 )
 
 from Rules.checks import BaseObjectRules
 from Rules.traversal import get_data_traversal_rules
-from Utilities.helpers import process_parameters, get_type_and_family, create_object_info
-from Utilities.report import generate_report
+from Utilities.helpers import (
+    process_parameters,
+    get_type_and_family,
+    get_id_and_name,
+    create_object_bucket,
+    append_object_info,
+)
+from Utilities.report import Format, generate_report
+
+# Number of objects listed individually in each attached result message
+MAX_DETAILED_MESSAGES = 10
+
+# Result level attached to objects for each parameter evaluation state
+RESULT_LEVELS = {
+    "missing": ObjectResultLevel.ERROR,
+    "invalid": ObjectResultLevel.ERROR,
+    "passing": ObjectResultLevel.INFO,
+}
 
 
 class ThresholdMode(Enum):
@@ -28,22 +47,14 @@ class ThresholdMode(Enum):
     INFO = "INFO"
 
 
-class Format(Enum):
-    """
-    Format: Enum for defining report formats.
-    """
-
-    PDF = "PDF"
-    HTML = "HTML"
-    JSON = "JSON"
-
-
+@cache
 def create_one_of_enum(enum_cls):
     """
     Helper function to create a JSON schema from an Enum class.
     This is used for generating user input forms in the UI.
+    The result is cached per Enum class, so callers share the same entries.
     """
-    return [{"const": item.value, "title": item.name} for item in enum_cls]
+    return tuple({"const": item.value, "title": item.name} for item in enum_cls)
 
 
 class FunctionInputs(AutomateBase):
@@ -127,56 +138,97 @@ def automate_function(
     speckle_data = get_data_traversal_rules()
     traversal_contexts_collection = speckle_data.traverse(version_root_object)
 
-    # Assuming each object has properties: name, type, and id
-    assessed_objects = {"missing": [], "invalid": [], "passing": []}
+    # Assuming each object has properties: name, type, and id. Each state holds
+    # parallel lists of ids, names, types and families.
+    assessed_objects = {
+        state: create_object_bucket() for state in ("missing", "invalid", "passing")
+    }
 
-    # Main loop for checking parameters
+    # Build the rule predicates once rather than per object
+    parameter_name_is = BaseObjectRules.parameter_name_is(
+        function_inputs.single_property
+    )
+    value_is_valid = BaseObjectRules.value_startswith(function_inputs.single_rule)
+
+    # First pass: index the objects that carry parameters by their category, so
+    # the requested category becomes a single lookup instead of a filter scan.
+    # The parameters are kept alongside each object so they are resolved once,
+    # and an object reached more than once by the traversal is only assessed once.
+    objects_by_category = defaultdict(list)
+    seen_ids = set()
     for context in traversal_contexts_collection:
         current_object = context.current
-        is_category = BaseObjectRules.is_category(function_inputs.single_category)
+        parameters = getattr(current_object, "parameters", None)
+        if parameters is None:
+            continue
 
-        if is_category(current_object) and hasattr(current_object, "parameters"):
-            assessment = process_parameters(current_object, function_inputs)
-            if assessment:
-                type_, family = get_type_and_family(current_object)
-                object_info = create_object_info(current_object, type_, family)
-                assessed_objects[assessment].append(object_info)
+        object_id = getattr(current_object, "id", None)
+        if object_id is not None:
+            if object_id in seen_ids:
+                continue
+            seen_ids.add(object_id)
+
+        objects_by_category[getattr(current_object, "category", None)].append(
+            (current_object, parameters)
+        )
+
+    # Type and family per Revit definition id, scoped to this run
+    definition_cache = {}
+
+    # Ids and detailed messages for the attached results are gathered while
+    # objects are assessed, with the messages capped so large failing models do
+    # not produce megabyte-sized ones
+    attached_ids = {state: [] for state in assessed_objects}
+    detailed_messages = {state: [] for state in assessed_objects}
+
+    # Main loop for checking parameters
+    for current_object, parameters in objects_by_category.get(
+        function_inputs.single_category, ()
+    ):
+        assessment = process_parameters(parameters, parameter_name_is, value_is_valid)
+        if not assessment:
+            continue
+
+        object_id, name = get_id_and_name(current_object)
+        type_, family = get_type_and_family(current_object, definition_cache)
+        append_object_info(
+            assessed_objects[assessment], object_id, name, type_, family
+        )
+
+        ids = attached_ids[assessment]
+        if object_id:
+            if len(ids) < MAX_DETAILED_MESSAGES:
+                detailed_messages[assessment].append(
+                    f"{name} (Type: {type_}, ID: {object_id})"
+                )
+            ids.append(object_id)
 
     # Attach errors or info to objects based on their parameter evaluation state
-    for state, objects in assessed_objects.items():
-        ids = [obj["id"] for obj in objects if "id" in obj and obj["id"]]
+    for state, ids in attached_ids.items():
         if not ids:
             continue
 
-        # Construct a detailed message for each object
-        detailed_messages = [
-            f"{obj['name']} (Type: {obj['type']}, ID: {obj['id']})"
-            for obj in objects
-            if "id" in obj and obj["id"]
-        ]
+        remaining = len(ids) - MAX_DETAILED_MESSAGES
+        tail = f"; ... and {remaining} more" if remaining > 0 else ""
 
         # Combine messages into a single string
         combined_message = (
-                f"Found {len(objects)} objects with {state} parameters: "
-                + "; ".join(detailed_messages)
+                f"Found {len(assessed_objects[state]['ids'])} objects with {state} parameters: "
+                + "; ".join(detailed_messages[state])
+                + tail
         )
 
-        if state in ["missing", "invalid"]:
-            automate_context.attach_error_to_objects(
-                category=state.capitalize(), object_ids=ids, message=combined_message
-            )
-        else:  # 'valid'
-            automate_context.attach_info_to_objects(
-                category=state.capitalize(), object_ids=ids, message=combined_message
-            )
+        automate_context.attach_result_to_objects(
+            level=RESULT_LEVELS[state],
+            category=state.capitalize(),
+            object_ids=ids,
+            message=combined_message,
+        )
 
     # Generate and attach the report
-    report_format = (
-        function_inputs.report_format.value
-    )  # Accessing the value of the Enum
     report_file = generate_report(
         assessed_objects,
-        report_format,
+        function_inputs.report_format,
         function_inputs.single_category,
         function_inputs.single_property,
         function_inputs.single_rule,
@@ -186,13 +238,16 @@ def automate_function(
     print("Report file: ", report_file)
 
     # Determine overall automation success or failure
-    if assessed_objects["missing"] or assessed_objects["invalid"]:
-        total_objects = len(assessed_objects["missing"]) + len(assessed_objects["invalid"]) + len(
-            assessed_objects["passing"])
+    missing_count = len(assessed_objects["missing"]["ids"])
+    invalid_count = len(assessed_objects["invalid"]["ids"])
+    passing_count = len(assessed_objects["passing"]["ids"])
+
+    if missing_count or invalid_count:
+        total_objects = missing_count + invalid_count + passing_count
 
-        pass_rate = len(assessed_objects["passing"]) / total_objects * 100
-        invalid_rate = len(assessed_objects["invalid"]) / total_objects * 100
-        missing_rate = len(assessed_objects["missing"]) / total_objects * 100
+        pass_rate = passing_count / total_objects * 100
+        invalid_rate = invalid_count / total_objects * 100
+        missing_rate = missing_count / total_objects * 100
 
         success_rating_message = f"Pass rate: {pass_rate:.2f}%, Invalid rate: {invalid_rate:.2f}%, Missing rate: {missing_rate:.2f}%"
 
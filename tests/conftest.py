@@ -1,24 +1,33 @@
 import os
 
+import pytest
 from dotenv import load_dotenv
 
+TOKEN_VAR = "SPECKLE_TOKEN"
+SERVER_VAR = "SPECKLE_SERVER_URL"
+
 
 def pytest_configure(config):
     load_dotenv(dotenv_path=".env")
 
-    token_var = "SPECKLE_TOKEN"
-    server_var = "SPECKLE_SERVER_URL"
-    token = os.getenv(token_var)
-    server = os.getenv(server_var)
+    # Set the token as an attribute on the config object. They are only checked
+    # by the fixtures below, so tests that need no server run without them.
+    config.SPECKLE_TOKEN = os.getenv(TOKEN_VAR)
+    config.SPECKLE_SERVER_URL = os.getenv(SERVER_VAR)
+
+
+def require_config_value(value, env_var: str) -> str:
+    if not value:
+        raise ValueError(f"Cannot run tests without a {env_var} environment variable")
+    return value
+
 
-    if not token:
-        raise ValueError(f"Cannot run tests without a {token_var} environment variable")
+@pytest.fixture()
+def speckle_token(request) -> str:
+    return require_config_value(request.config.SPECKLE_TOKEN, TOKEN_VAR)
 
-    if not server:
-        raise ValueError(
-            f"Cannot run tests without a {server_var} environment variable"
-        )
 
-    # Set the token as an attribute on the config object
-    config.SPECKLE_TOKEN = token
-    config.SPECKLE_SERVER_URL = server
+@pytest.fixture()
+def speckle_server_url(request) -> str:
+    """Provide a speckle server url for the test suite, default to localhost."""
+    return require_config_value(request.config.SPECKLE_SERVER_URL, SERVER_VAR)
@@ -0,0 +1,206 @@
+"""Run automate_function against an in-memory model, no speckle server needed."""
+
+import json
+import re
+import zlib
+from pathlib import Path
+
+import pytest
+from specklepy.objects import Base
+from specklepy.objects.other import RevitParameter
+
+from main import MAX_DETAILED_MESSAGES, FunctionInputs, ThresholdMode, automate_function
+
+
+class FakeAutomationContext:
+    """Stands in for AutomationContext, recording what the function reports."""
+
+    def __init__(self, root: Base) -> None:
+        self.root = root
+        self.results = []
+        self.files = []
+        self.status = None
+        self.status_message = None
+
+    def receive_version(self) -> Base:
+        return self.root
+
+    def attach_result_to_objects(self, level, category, object_ids, message=None):
+        self.results.append((level.value, category, list(object_ids), message))
+
+    def store_file_result(self, file_path: str) -> None:
+        self.files.append(file_path)
+
+    def mark_run_failed(self, message: str) -> None:
+        self.status, self.status_message = "FAILED", message
+
+    def mark_run_success(self, message: str) -> None:
+        self.status, self.status_message = "SUCCEEDED", message
+
+
+def make_window(index: int, value: str, category: str = "Windows") -> Base:
+    window = Base()
+    window.id = f"window-{index}"
+    window.name = f"Window {index}"
+    window.category = category
+    window.type = "Casement"
+    window.family = "Window Family"
+    parameters = Base()
+    parameters["mark"] = RevitParameter(name="Mark", value=str(index))
+    parameters["omniclass"] = RevitParameter(name="OmniClass Number", value=value)
+    window.parameters = parameters
+    return window
+
+
+def make_model(values, extra_elements=()) -> Base:
+    root = Base()
+    root["@elements"] = [
+        make_window(index, value) for index, value in enumerate(values)
+    ] + list(extra_elements)
+    return root
+
+
+def run(root: Base, **inputs) -> FakeAutomationContext:
+    context = FakeAutomationContext(root)
+    automate_function(
+        context,
+        FunctionInputs(
+            single_category="Windows",
+            single_property="OmniClass Number",
+            single_rule="23.30.20",
+            **inputs,
+        ),
+    )
+    return context
+
+
+def report_ids(rows) -> list:
+    """Report row ids, sorted since the traversal order is not part of the contract."""
+    return sorted(row["id"] for row in rows)
+
+
+def read_json_report(context: FakeAutomationContext) -> dict:
+    (report_file,) = context.files
+    with open(report_file) as file:
+        return json.load(file)["Results"]
+
+
+def read_pdf_text(path: Path) -> str:
+    """Decompress the page content streams of a PDF written by fpdf."""
+    streams = re.findall(rb"stream\n(.*?)\nendstream", path.read_bytes(), re.S)
+    return "".join(zlib.decompress(stream).decode("latin-1") for stream in streams)
+
+
+@pytest.fixture(autouse=True)
+def report_dir(tmp_path, monkeypatch):
+    """Write report files into a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("threshold_mode", list(ThresholdMode))
+def test_every_state_is_reported_in_each_threshold_mode(threshold_mode):
+    root = make_model(["23.30.20.01", "99.1", "", "23.30.20.02"])
+
+    context = run(root, report_format="JSON", threshold_mode=threshold_mode)
+
+    results = read_json_report(context)
+    assert report_ids(results["passing"]) == ["window-0", "window-3"]
+    assert report_ids(results["invalid"]) == ["window-1"]
+    assert report_ids(results["missing"]) == ["window-2"]
+    assert {
+        "name": "Window 0",
+        "type": "Casement",
+        "family": "Window Family",
+        "id": "window-0",
+    } in results["passing"]
+
+    attached = {
+        category: (level, sorted(ids)) for level, category, ids, _ in context.results
+    }
+    assert attached == {
+        "Missing": ("ERROR", ["window-2"]),
+        "Invalid": ("ERROR", ["window-1"]),
+        "Passing": ("INFO", ["window-0", "window-3"]),
+    }
+    assert context.status == "FAILED"
+    assert "Pass rate: 50.00%" in context.status_message
+
+
+def test_other_categories_are_ignored():
+    door = make_window(99, "", category="Doors")
+
+    context = run(make_model(["23.30.20.01"], [door]), report_format="JSON")
+
+    assert context.status == "SUCCEEDED"
+    assert report_ids(read_json_report(context)["missing"]) == []
+
+
+def test_object_referenced_twice_is_assessed_once():
+    root = make_model(["23.30.20.01", "99.1"])
+    root["@elements"].append(root["@elements"][0])
+
+    context = run(root, report_format="JSON")
+
+    results = read_json_report(context)
+    assert report_ids(results["passing"]) == ["window-0"]
+    assert "Pass rate: 50.00%" in context.status_message
+
+
+def test_detailed_message_is_capped_with_tail():
+    extra = 3
+    root = make_model([""] * (MAX_DETAILED_MESSAGES + extra))
+
+    context = run(root, report_format="JSON")
+
+    ((level, category, ids, message),) = context.results
+    assert (level, category) == ("ERROR", "Missing")
+    assert len(ids) == MAX_DETAILED_MESSAGES + extra
+    assert message.startswith(
+        f"Found {MAX_DETAILED_MESSAGES + extra} objects with missing parameters: "
+    )
+    assert message.count("(Type: ") == MAX_DETAILED_MESSAGES
+    assert message.endswith(f"; ... and {extra} more")
+
+
+def test_detailed_message_has_no_tail_below_cap():
+    context = run(make_model(["", ""]), report_format="JSON")
+
+    ((_, _, _, message),) = context.results
+    prefix = "Found 2 objects with missing parameters: "
+    assert message.startswith(prefix)
+    assert sorted(message[len(prefix):].split("; ")) == [
+        "Window 0 (Type: Casement, ID: window-0)",
+        "Window 1 (Type: Casement, ID: window-1)",
+    ]
+
+
+def test_json_report_is_written_by_the_stdlib_encoder():
+    root = make_model(["23.30.20.01"])
+    root["@elements"][0].name = "Fenêtre 0"
+
+    context = run(root, report_format="JSON")
+
+    with open(context.files[0]) as file:
+        text = file.read()
+    assert text.startswith('{\n    "Assessment Criteria": {\n        "Category"')
+    assert '"name": "Fen\\u00eatre 0"' in text
+
+
+def test_html_report_lists_every_row():
+    context = run(make_model(["23.30.20.01", "99.1"]), report_format="HTML")
+
+    assert context.files == ["report.html"]
+    html = Path("report.html").read_text()
+    assert "<td>Window 0</td><td>Casement</td><td>Window Family</td>" in html
+    assert "<td>window-0</td><td>passing</td>" in html
+    assert "<td>window-1</td><td>invalid</td>" in html
+
+
+def test_pdf_report_lists_every_row():
+    context = run(make_model(["23.30.20.01", "99.1"]), report_format="PDF")
+
+    assert context.files == ["report.pdf"]
+    text = read_pdf_text(Path("report.pdf"))
+    assert "(Criteria: Windows - OmniClass Number - 23.30.20)" in text
+    assert "(Window 0 | Casement | Window Family | window-0 | passing)" in text
+    assert "(Window 1 | Casement | Window Family | window-1 | invalid)" in text
@@ -0,0 +1,86 @@
+"""Unit tests for the parameter rules and actions, no speckle server needed."""
+
+from specklepy.objects import Base
+from specklepy.objects.other import RevitParameter
+
+from Rules.actions import ParameterAction
+from Rules.checks import REVIT_PARAMETER_TYPE, BaseObjectRules, has_speckle_type
+
+
+class RecordingAction(ParameterAction):
+    """Minimal action recording every parameter it is applied to."""
+
+    def apply(self, parameter, parent_object) -> None:
+        self.parent_ids.append(parent_object)
+        self.param_names.append(parameter)
+
+    def report(self, automate_context) -> None:
+        pass
+
+
+def test_affected_parameters_by_parent_groups_names():
+    action = RecordingAction()
+    action.apply("Mark", "wall-2")
+    action.apply("Comments", "wall-1")
+    action.apply("Height", "wall-2")
+
+    assert list(action.affected_parameters_by_parent()) == [
+        ("wall-1", ["Comments"]),
+        ("wall-2", ["Mark", "Height"]),
+    ]
+
+
+def test_forbidden_prefix_rule_accepts_single_prefix():
+    rule = BaseObjectRules.forbidden_prefix_rule("Ifc")
+
+    assert rule(RevitParameter(name="IfcName"))
+    assert not rule(RevitParameter(name="Pset_Common"))
+
+
+def test_forbidden_prefix_rule_accepts_several_prefixes():
+    rule = BaseObjectRules.forbidden_prefix_rule(["Ifc", "Pset"])
+
+    assert rule(RevitParameter(name="IfcName"))
+    assert rule(RevitParameter(name="Pset_Common"))
+    assert not rule(RevitParameter(name="Mark"))
+
+
+def test_parameter_value_startswith_accepts_several_prefixes():
+    rule = BaseObjectRules.parameter_value_startswith(("Ifc", "Pset"))
+
+    assert rule(RevitParameter(name="Pset_Common"))
+    assert not rule(RevitParameter(name="Comments"))
+
+
+def test_parameter_name_is_treats_missing_name_as_no_match():
+    rule = BaseObjectRules.parameter_name_is("OmniClass Number")
+
+    assert rule(RevitParameter(name="OmniClass Number"))
+    assert not rule(RevitParameter(name="Mark"))
+    assert not rule(Base())
+
+
+def test_speckle_type_rule_treats_missing_type_as_no_match():
+    rule = BaseObjectRules.speckle_type_rule(REVIT_PARAMETER_TYPE)
+
+    assert rule(RevitParameter())
+    assert not rule(Base())
+    assert not rule(object())
+
+
+def test_has_speckle_type():
+    assert has_speckle_type(RevitParameter(), REVIT_PARAMETER_TYPE)
+    assert not has_speckle_type(Base(), REVIT_PARAMETER_TYPE)
+    assert not has_speckle_type(object(), REVIT_PARAMETER_TYPE)
+
+
+def test_evaluate_parameter_states():
+    value_is_valid = BaseObjectRules.value_startswith("23.30.20")
+
+    def evaluate(parameter):
+        return BaseObjectRules.evaluate_parameter(parameter, value_is_valid)
+
+    assert evaluate(RevitParameter(name="p", value="23.30.20.01")) == "passing"
+    assert evaluate(RevitParameter(name="p", value="99.1")) == "invalid"
+    assert evaluate(RevitParameter(name="p", value="")) == "missing"
+    assert evaluate(Base()) is None
@@ -0,0 +1,80 @@
+"""Unit tests for the flattening helpers, no speckle server needed."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from specklepy.objects import Base
+from specklepy.objects.other import Instance, Transform
+
+from Utilities.flatten import extract_base_and_transform, flatten_base
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Prints the order '@'-prefixed children are visited in, run in a subprocess so
+# the hash seed can be varied.
+ORDER_SCRIPT = """
+from specklepy.objects import Base
+from Utilities.flatten import extract_base_and_transform
+
+root = Base()
+for name in "edcba":
+    child = Base()
+    child.elements = []
+    child.applicationId = name
+    root["@" + name] = child
+children = [b.applicationId for b, _, _ in extract_base_and_transform(root)][1:]
+print(",".join(children))
+"""
+
+
+def make_base(application_id: str, **members) -> Base:
+    base = Base()
+    base.applicationId = application_id
+    for name, value in members.items():
+        base[name] = value
+    return base
+
+
+def test_flatten_base_yields_leaves_in_order():
+    first = make_base("first")
+    second = make_base("second")
+    third = make_base("third")
+    group = make_base("group", elements=[first, second])
+    root = make_base("root", elements=[group, third])
+
+    leaves = list(flatten_base(root))
+
+    assert [leaf.applicationId for leaf in leaves] == ["first", "second", "third"]
+    assert first["parent_type"] == group.speckle_type
+
+
+def test_extract_base_and_transform_carries_instance_transforms():
+    definition = make_base("definition")
+    instance = Instance(transform=Transform(), definition=definition)
+    sibling = make_base("sibling")
+    root = make_base("root", elements=[instance, sibling])
+
+    results = [
+        (base.applicationId, len(transforms))
+        for base, _, transforms in extract_base_and_transform(root)
+    ]
+
+    assert results == [("root", 0), ("definition", 1), ("sibling", 0)]
+
+
+def test_extract_base_and_transform_order_ignores_hash_seed():
+    orders = set()
+    for seed in ("1", "2", "3", "4"):
+        result = subprocess.run(
+            [sys.executable, "-c", ORDER_SCRIPT],
+            cwd=REPO_ROOT,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        orders.add(result.stdout.strip())
+
+    assert orders == {"a,b,c,d,e"}
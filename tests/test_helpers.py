@@ -0,0 +1,57 @@
+"""Unit tests for the object helpers, no speckle server needed."""
+
+from specklepy.objects import Base
+from specklepy.objects.other import RevitInstance
+from specklepy.serialization.base_object_serializer import BaseObjectSerializer
+
+from Utilities.helpers import get_type_and_family
+
+
+def make_definition(type_: str, family: str) -> Base:
+    definition = Base()
+    definition.type = type_
+    definition.family = family
+    return definition
+
+
+def receive(base: Base) -> Base:
+    """Round-trip an object through the serializer, as a received version is."""
+    serializer = BaseObjectSerializer()
+    _, serialized = serializer.write_json(base)
+    return serializer.read_json(serialized)
+
+
+def test_instances_sharing_a_definition_resolve_it_once():
+    definition = make_definition("Casement", "Window Family")
+    root = Base()
+    root["@elements"] = [
+        RevitInstance(definition=definition),
+        RevitInstance(definition=definition),
+    ]
+    first, second = receive(root)["@elements"]
+    definition_cache = {}
+
+    assert isinstance(first, RevitInstance)
+    assert get_type_and_family(first, definition_cache) == ("Casement", "Window Family")
+    assert definition_cache == {first.definition.id: ("Casement", "Window Family")}
+
+    # A cache hit returns the stored pair without reading the definition again
+    second.definition.type = "Changed"
+    assert get_type_and_family(second, definition_cache) == (
+        "Casement",
+        "Window Family",
+    )
+    assert get_type_and_family(second) == ("Changed", "Window Family")
+
+
+def test_instance_without_definition_reports_its_own_type_and_family():
+    instance = RevitInstance(definition=None)
+    instance.type = "Fixed"
+    instance.family = "Instance Family"
+    definition_cache = {}
+
+    assert get_type_and_family(instance, definition_cache) == (
+        "Fixed",
+        "Instance Family",
+    )
+    assert definition_cache == {}
@@ -65,17 +65,6 @@ def register_new_automation(
     speckle_client.httpclient.execute(query, params)
 
 
-@pytest.fixture()
-def speckle_token(request) -> str:
-    return request.config.SPECKLE_TOKEN
-
-
-@pytest.fixture()
-def speckle_server_url(request) -> str:
-    """Provide a speckle server url for the test suite, default to localhost."""
-    return request.config.SPECKLE_SERVER_URL
-
-
 @pytest.fixture()
 def test_client(speckle_server_url: str, speckle_token: str) -> SpeckleClient:
     """Initialize a SpeckleClient for testing."""